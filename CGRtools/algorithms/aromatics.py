@@ -105,6 +105,7 @@ class Aromatize:
         for form in self.__kekule_full():
             copy = self.copy()
             copy._Aromatize__kekule_patch(form)
+            copy.flush_cache()
             yield copy
 
     def check_thiele(self, fast=True) -> bool:
@@ -132,17 +132,22 @@ class GraphComponents:
         return sum(len(x) for x in bonds.values()) // 2 - len(bonds) + self.connected_components_count
 
     def _augmented_substructure(self, atoms, deep):
-        atoms = set(atoms)
+        """
+        generate cumulative sets of atoms and their neighbors up to deep.
+        the same set is yielded each time and updated in place.
+        """
+        seen = set(atoms)
         bonds = self._bonds
-        if atoms - self._atoms.keys():
+        if seen - self._atoms.keys():
             raise ValueError('invalid atom numbers')
-        nodes = [atoms]
-        for i in range(deep):
-            n = {y for x in nodes[-1] for y in bonds[x]} | nodes[-1]
-            if n in nodes:
+        yield seen
+        frontier = seen
+        for _ in range(deep):
+            frontier = {m for n in frontier for m in bonds[n]} - seen  # expand only last added atoms
+            if not frontier:
                 break
-            nodes.append(n)
-        return nodes
+            seen |= frontier
+            yield seen
 
 
 class StructureComponents:
@@ -265,10 +270,9 @@ class CGRComponents:
             if c != p_charges[n] or radicals[n] != p_radicals[n]:
                 center.add(n)
 
-        for n, m_bond in self._bonds.items():
-            for m, bond in m_bond.items():
-                if bond.order != bond.p_order:
-                    adj[n].add(m)
+        for n, m in self.center_bonds:
+            adj[n].add(m)
+            adj[m].add(n)
         center.update(adj)
 
         # changes in condensed aromatic rings.
@@ -320,15 +324,8 @@ class CGRComponents:
         p_charges = self._p_charges
         p_radicals = self._p_radicals
 
-        center = set()
-        for n, c in self._charges.items():
-            if c != p_charges[n] or radicals[n] != p_radicals[n]:
-                center.add(n)
-
-        for n, m_bond in self._bonds.items():
-            if any(bond.order != bond.p_order for bond in m_bond.values()):
-                center.add(n)
-
+        center = {n for n, c in self._charges.items() if c != p_charges[n] or radicals[n] != p_radicals[n]}
+        center.update(x for x in self.center_bonds for x in x)  # dynamic bonds already found once per bond
         return tuple(center)
 
     @cached_property
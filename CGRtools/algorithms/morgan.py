@@ -75,7 +75,8 @@ class Morgan:
 
     def _morgan(self, weights: Dict[int, int]) -> Dict[int, int]:
         atoms = self._atoms
-        bonds = self._bonds
+        # flat adjacency with precalculated bonds weights. avoids bond objects access in each iteration.
+        bonds = {n: [(m, int(b)) for m, b in ms.items()] for n, ms in self._bonds.items()}
 
         tries = len(atoms) - 1
         numb = len(set(weights.values()))
@@ -83,7 +84,7 @@ class Morgan:
 
         for _ in range(tries):
             weights = {n: tuple_hash((weights[n],
-                                      *(x for x in sorted((weights[m], int(b)) for m, b in ms.items()) for x in x)))
+                                      *(x for x in sorted((weights[m], b) for m, b in ms) for x in x)))
                        for n, ms in bonds.items()}
             old_numb, numb = numb, len(set(weights.values()))
             if numb == len(atoms):  # each atom now unique
@@ -51,11 +51,13 @@ class Standardize:
                 self.flush_cache()
             for n in hs:
                 self._calc_implicit(n)
+                self._calc_hybridization(n)
             # second round. need for intersected groups.
             hs, lg = self.__standardize()
             log.extend(lg)
             for n in hs:
                 self._calc_implicit(n)
+                self._calc_hybridization(n)
             if fix_stereo:
                 self._fix_stereo()
             if logging:
@@ -203,6 +205,7 @@ class Standardize:
         radicals = self._radicals
         bonds = self._bonds
         errors = set(atoms)
+        numbers = {n: atom.atomic_number for n, atom in atoms.items()}  # avoid atom property call per neighbor
         for n, atom in atoms.items():
             charge = charges[n]
             is_radical = radicals[n]
@@ -214,7 +217,7 @@ class Standardize:
                     break
                 elif order != 8:  # any bond used for complexes
                     explicit_sum += order
-                    explicit_dict[(order, atoms[m].atomic_number)] += 1
+                    explicit_dict[(order, numbers[m])] += 1
             else:
                 try:
                     rules = atom.valence_rules(charge, is_radical, explicit_sum)
@@ -83,6 +83,31 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
             self._calc_hybridization(n)
             self._calc_hybridization(m)
 
+    def _add_bonds(self, bonds: List[Tuple[int, int, Union[DynamicBond, Bond]]]):
+        """
+        Bulk bonds addition without validation. Used for composition.
+        Hybridization recalculated once per atom with changed bonds.
+        """
+        sb = self._bonds
+        changed = set()
+        for n, m, bond in bonds:
+            if isinstance(bond, Bond):
+                order = p_order = bond.order
+                bond = object.__new__(DynamicBond)
+                bond._DynamicBond__order = bond._DynamicBond__p_order = order
+            else:
+                order = bond.order
+                p_order = bond.p_order
+            sb[n][m] = sb[m][n] = bond
+            if order != 1 or p_order != 1:  # 1 is neutral.
+                changed.add(n)
+                changed.add(m)
+
+        for n in changed:
+            self._calc_hybridization(n)
+        self._conformers.clear()
+        self.flush_cache()
+
     def delete_atom(self, n):
         old_bonds = self._bonds[n]  # save bonds
         super().delete_atom(n)
@@ -191,11 +216,17 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
                 atom._attach_to_graph(sub, n)
 
             # recalculate query marks
-                # recalculate query marks
+            sb = self._bonds
+            sh = self._hybridizations
+            sph = self._p_hybridizations
             sub._hybridizations = {}
             sub._p_hybridizations = {}
-            for n in sub._atoms:
-                sub._calc_hybridization(n)
+            for n, m_bond in sub._bonds.items():
+                if len(m_bond) == len(sb[n]):  # all neighbors kept. hybridization not changed.
+                    sub._hybridizations[n] = sh[n]
+                    sub._p_hybridizations[n] = sph[n]
+                else:
+                    sub._calc_hybridization(n)
         return sub
 
     def union(self, other, **kwargs):
@@ -242,6 +273,8 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
                 atom._attach_to_graph(u, n)
             return u
         elif isinstance(other, Graph):  # Query or CGRQuery
+            if not kwargs.get('copy', True):
+                raise TypeError('inplace union of different graph types impossible')
             return other.union(self, **kwargs)
         else:
             raise TypeError('Graph expected')
@@ -262,9 +295,11 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
         sb = self._bonds
 
         bonds = []
+        append_bond = bonds.append
         adj: Dict[int, Dict[int, List[Optional[int]]]] = defaultdict(lambda: defaultdict(lambda: [None, None]))
         h = self.__class__()  # subclasses support
         atoms = h._atoms
+        add_atom = h.add_atom
 
         if isinstance(other, molecule.MoleculeContainer):
             oa = other._atoms
@@ -275,8 +310,8 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
             common = sa.keys() & other
 
             for n in sa.keys() - common:  # cleavage atoms
-                h.add_atom(sa[n].copy(), n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=spc[n],
-                           p_is_radical=spr[n])
+                add_atom(sa[n].copy(), n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=spc[n],
+                         p_is_radical=spr[n])
                 for m, bond in sb[n].items():
                     if m not in atoms:
                         if m in common:  # bond to common atoms is broken bond
@@ -284,18 +319,18 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
                             if order:  # skip formed bond. None>X => None>None
                                 bond = object.__new__(DynamicBond)
                                 bond._DynamicBond__order, bond._DynamicBond__p_order = order, None
-                                bonds.append((n, m, bond))
+                                append_bond((n, m, bond))
                         else:
-                            bonds.append((n, m, bond))
+                            append_bond((n, m, bond))
             for n in other._atoms.keys() - common:  # coupling atoms
-                h.add_atom(oa[n], n, charge=oc[n], is_radical=or_[n], xy=op[n], p_charge=oc[n], p_is_radical=or_[n])
+                add_atom(oa[n], n, charge=oc[n], is_radical=or_[n], xy=op[n], p_charge=oc[n], p_is_radical=or_[n])
                 for m, bond in ob[n].items():
                     if m not in atoms:
                         if m in common:  # bond to common atoms is formed bond
                             order = bond.order
                             bond = object.__new__(DynamicBond)
                             bond._DynamicBond__order, bond._DynamicBond__p_order = None, order
-                        bonds.append((n, m, bond))
+                        append_bond((n, m, bond))
             for n in common:
                 an = adj[n]
                 for m, bond in ob[n].items():
@@ -308,12 +343,12 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
                 san = sa[n]
                 if san.atomic_number != oa[n].atomic_number or san.isotope != oa[n].isotope:
                     raise MappingError(f'atoms with number {{{n}}} not equal')
-                h.add_atom(san.copy(), n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=oc[n], p_is_radical=or_[n])
+                add_atom(san.copy(), n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=oc[n], p_is_radical=or_[n])
                 for m, (o1, o2) in adj[n].items():
                     if m not in atoms:
                         bond = object.__new__(DynamicBond)
                         bond._DynamicBond__order, bond._DynamicBond__p_order = o1, o2
-                        bonds.append((n, m, bond))
+                        append_bond((n, m, bond))
         elif isinstance(other, CGRContainer):
             oa = other._atoms
             oc = other._charges
@@ -325,8 +360,8 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
             common = sa.keys() & other
 
             for n in sa.keys() - common:  # cleavage atoms
-                h.add_atom(sa[n].copy(), n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=spc[n],
-                           p_is_radical=spr[n])
+                add_atom(sa[n].copy(), n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=spc[n],
+                         p_is_radical=spr[n])
                 for m, bond in sb[n].items():
                     if m not in atoms:
                         if m in common:  # bond to common atoms is broken bond
@@ -334,12 +369,12 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
                             if order:  # skip formed bond. None>X => None>None
                                 bond = object.__new__(DynamicBond)
                                 bond._DynamicBond__order, bond._DynamicBond__p_order = order, None
-                                bonds.append((n, m, bond))
+                                append_bond((n, m, bond))
                         else:
-                            bonds.append((n, m, bond))
+                            append_bond((n, m, bond))
             for n in other._atoms.keys() - common:  # coupling atoms
-                h.add_atom(oa[n].copy(), n, charge=oc[n], is_radical=or_[n], xy=op[n], p_charge=opc[n],
-                           p_is_radical=opr[n])
+                add_atom(oa[n].copy(), n, charge=oc[n], is_radical=or_[n], xy=op[n], p_charge=opc[n],
+                         p_is_radical=opr[n])
                 for m, bond in ob[n].items():
                     if m not in atoms:
                         if m in common:  # bond to common atoms is formed bond
@@ -347,9 +382,9 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
                             if order:  # skip broken bond. X>None => None>None
                                 bond = object.__new__(DynamicBond)
                                 bond._DynamicBond__order, bond._DynamicBond__p_order = None, order
-                                bonds.append((n, m, bond))
+                                append_bond((n, m, bond))
                         else:
-                            bonds.append((n, m, bond))
+                            append_bond((n, m, bond))
             for n in common:
                 an = adj[n]
                 for m, bond in sb[n].items():
@@ -363,18 +398,17 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
                 san = sa[n]
                 if san.atomic_number != oa[n].atomic_number or san.isotope != oa[n].isotope:
                     raise MappingError(f'atoms with number {{{n}}} not equal')
-                h.add_atom(san.copy(), n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=opc[n],
-                           p_is_radical=opr[n])
+                add_atom(san.copy(), n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=opc[n],
+                         p_is_radical=opr[n])
                 for m, (o1, o2) in adj[n].items():
                     if m not in atoms:
                         bond = object.__new__(DynamicBond)
                         bond._DynamicBond__order, bond._DynamicBond__p_order = o1, o2
-                        bonds.append((n, m, bond))
+                        append_bond((n, m, bond))
         else:
             raise TypeError('MoleculeContainer or CGRContainer expected')
 
-        for n, m, bond in bonds:
-            h.add_bond(n, m, bond)
+        h._add_bonds(bonds)
         return h
 
     def __xor__(self, other):
@@ -428,36 +462,34 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
 
     def _calc_hybridization(self, n: int):
         hybridization = p_hybridization = 1
+        doubles = p_doubles = 0
         for bond in self._bonds[n].values():
             order = bond.order
+            if order == 4:
+                hybridization = 4
+            elif order == 3:
+                if hybridization != 4:
+                    hybridization = 3
+            elif order == 2:
+                doubles += 1
             p_order = bond.p_order
-            if order and hybridization != 4:
-                if order == 4:
-                    hybridization = 4
-                elif order == 3:
-                    if hybridization != 3:
-                        hybridization = 3
-                elif order == 2:
-                    if hybridization == 2:
-                        hybridization = 3
-                    elif hybridization == 1:
-                        hybridization = 2
-            if p_order and p_hybridization != 4:
-                if p_order == 4:
-                    p_hybridization = 4
-                elif p_order == 3:
-                    if p_hybridization != 3:
-                        p_hybridization = 3
-                elif p_order == 2:
-                    if p_hybridization == 2:
-                        p_hybridization = 3
-                    elif p_hybridization == 1:
-                        p_hybridization = 2
+            if p_order == 4:
+                p_hybridization = 4
+            elif p_order == 3:
+                if p_hybridization != 4:
+                    p_hybridization = 3
+            elif p_order == 2:
+                p_doubles += 1
+        if hybridization == 1 and doubles:
+            hybridization = 3 if doubles > 1 else 2
+        if p_hybridization == 1 and p_doubles:
+            p_hybridization = 3 if p_doubles > 1 else 2
         self._hybridizations[n] = hybridization
         self._p_hybridizations[n] = p_hybridization
 
     def __getstate__(self):
         return {'conformers': self._conformers, 'p_charges': self._p_charges, 'p_radicals': self._p_radicals,
+                'hybridizations': self._hybridizations, 'p_hybridizations': self._p_hybridizations,
                 **super().__getstate__()}
 
     def __setstate__(self, state):
@@ -470,10 +502,14 @@ class CGRContainer(Graph, CGRSmiles, CGRComponents, DepictCGR, Calculate2DCGR, X
             self._conformers = []  # < 4.0.23 compatibility
 
         # restore query marks
-        self._hybridizations = {}
-        self._p_hybridizations = {}
-        for n in state['bonds']:
-            self._calc_hybridization(n)
+        if 'hybridizations' in state:
+            self._hybridizations = state['hybridizations']
+            self._p_hybridizations = state['p_hybridizations']
+        else:  # < 4.0.34 compatibility
+            self._hybridizations = {}
+            self._p_hybridizations = {}
+            for n in state['bonds']:
+                self._calc_hybridization(n)
 
 
 __all__ = ['CGRContainer']
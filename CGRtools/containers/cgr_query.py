@@ -315,9 +315,10 @@ class QueryCGRContainer(Graph, QueryCGRSmiles, DepictQueryCGR, Calculate2DCGR):
         if len(neighbors) != len(p_neighbors):
             raise ValueError('neighbors and p_neighbors should be same length')
         if neighbors:
-            if len(set(zip(neighbors, p_neighbors))) != len(neighbors):
+            pairs = sorted(zip(neighbors, p_neighbors))
+            if len(set(pairs)) != len(pairs):
                 raise ValueError('paired neighbors and p_neighbors should be unique')
-            neighbors, p_neighbors = zip(*sorted(zip(neighbors, p_neighbors)))
+            neighbors, p_neighbors = zip(*pairs)
         return neighbors, p_neighbors
 
     @staticmethod
@@ -325,9 +326,10 @@ class QueryCGRContainer(Graph, QueryCGRSmiles, DepictQueryCGR, Calculate2DCGR):
         if len(hybridization) != len(p_hybridization):
             raise ValueError('hybridization and p_hybridization should be same length')
         if hybridization:
-            if len(set(zip(hybridization, p_hybridization))) != len(hybridization):
+            pairs = sorted(zip(hybridization, p_hybridization))
+            if len(set(pairs)) != len(pairs):
                 raise ValueError('paired hybridization and p_hybridization should be unique')
-            hybridization, p_hybridization = zip(*sorted(zip(hybridization, p_hybridization)))
+            hybridization, p_hybridization = zip(*pairs)
         return hybridization, p_hybridization
 
     def __getstate__(self):
@@ -31,7 +31,10 @@ from ..periodictable import AnyAtom
 
 class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
     __slots__ = ('_atoms', '_bonds', '_plane', '_charges', '_radicals', '__meta', '__name', '_parsed_mapping',
-                 '__dict__', '__weakref__')
+                 '_max_map', '__dict__', '__weakref__')
+    # cached values depending only on graph state. safe for sharing between copies.
+    _copyable_cache = ('atoms_order', '__cached_method___str__', '__cached_method___hash__',
+                       '__cached_method___bytes__')
 
     def __init__(self):
         """
@@ -43,6 +46,7 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
         self._plane: Dict[int, Tuple[float, float]] = {}
         self._bonds: Dict[int, Dict[int, Union[Bond, DynamicBond]]] = {}
         self._parsed_mapping: Dict[int, int] = {}
+        self._max_map = 0  # the biggest atom number. used for new atoms numbering
         self.__meta = {}
         self.__name = ''
 
@@ -62,6 +66,7 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
         self._parsed_mapping = state['parsed_mapping']
         self.__meta = state['meta']
         self.__name = state.get('name', '')  # 4.0.9 compatibility
+        self._max_map = max(self._atoms, default=0)
 
     def __len__(self):
         return len(self._atoms)
@@ -153,7 +158,7 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
         new atom addition
         """
         if _map is None:
-            _map = max(self._atoms, default=0) + 1
+            _map = self._max_map + 1
         elif not isinstance(_map, int):
             raise TypeError('mapping should be integer')
         elif _map in self._atoms:
@@ -171,6 +176,8 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
         self._plane[_map] = xy
         self._bonds[_map] = {}
         atom._attach_to_graph(self, _map)
+        if _map > self._max_map:
+            self._max_map = _map
         self.__dict__.clear()
         return _map
 
@@ -205,6 +212,8 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
             del self._parsed_mapping[n]
         except KeyError:
             pass
+        if n == self._max_map:
+            self._max_map = max(self._atoms, default=0)
         self.__dict__.clear()
 
     def delete_bond(self, n: int, m: int):
@@ -269,8 +278,11 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
             hm[mg(n, n)] = m
 
         if copy:
+            h._max_map = max(ha, default=0)
             return h
 
+        self._max_map = max(ha, default=0)
+
         self._bonds = hb
         self._parsed_mapping = hm
         self.__dict__.clear()
@@ -295,6 +307,7 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
         copy._radicals = self._radicals.copy()
         copy._plane = self._plane.copy()
         copy._parsed_mapping = self._parsed_mapping.copy()
+        copy._max_map = self._max_map
 
         copy._bonds = cb = {}
         for n, m_bond in self._bonds.items():
@@ -310,6 +323,9 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
             atom = atom.copy()
             ca[n] = atom
             atom._attach_to_graph(copy, n)
+
+        cache = self.__dict__
+        copy.__dict__.update((k, cache[k]) for k in self._copyable_cache if k in cache)
         return copy
 
     @abstractmethod
@@ -337,6 +353,7 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
         sub._radicals = {n: sr[n] for n in atoms}
         sub._plane = {n: sp[n] for n in atoms}
         sub._parsed_mapping = {n: m for n, m in self._parsed_mapping.items() if n in atoms}
+        sub._max_map = max(atoms)
 
         sub._bonds = cb = {}
         for n in atoms:
@@ -375,7 +392,8 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
         :param meta: copy metadata to each substructure
         :param as_query: return Query object based on graph substructure. for Molecule and CGR only
         """
-        return self.substructure(self._augmented_substructure(atoms, deep)[-1], **kwargs)
+        *_, seen = self._augmented_substructure(atoms, deep)  # the same set updated in place
+        return self.substructure(seen, **kwargs)
 
     def augmented_substructures(self, atoms: Iterable[int], deep: int = 1, **kwargs) -> List['Graph']:
         """
@@ -388,25 +406,32 @@ class Graph(GraphComponents, Morgan, SSSR, Isomorphism, MCS, ABC):
         :return: list of graphs containing atoms, atoms + first circle, atoms + 1st + 2nd,
             etc up to deep or while new nodes available
         """
-        return [self.substructure(a, **kwargs) for a in self._augmented_substructure(atoms, deep)]
+        return [self.substructure(a.copy(), **kwargs) for a in self._augmented_substructure(atoms, deep)]
 
-    def union(self, other: 'Graph', *, remap=False) -> 'Graph':
+    def union(self, other: 'Graph', *, remap=False, copy=True) -> 'Graph':
         """
         Merge Graphs into one.
 
         :param remap: if atoms has collisions then remap other graph atoms else raise exception.
+        :param copy: if False merge other graph into self and return self.
         """
         if self._atoms.keys() & other._atoms.keys():
             if remap:
-                other = other.remap({n: i for i, n in enumerate(other, start=max(self._atoms) + 1)}, copy=True)
+                other = other.remap({n: i for i, n in enumerate(other, start=self._max_map + 1)}, copy=True)
             else:
                 raise ValueError('mapping of graphs is not disjoint')
 
-        u = self.copy(meta=False)
+        if copy:
+            u = self.copy(meta=False)
+        else:
+            u = self
+        u.flush_cache()
         u._charges.update(other._charges)
         u._radicals.update(other._radicals)
         u._plane.update(other._plane)
         u._parsed_mapping.update(other._parsed_mapping)
+        if other._max_map > u._max_map:
+            u._max_map = other._max_map
         return u, other
 
     def __or__(self, other):
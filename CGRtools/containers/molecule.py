@@ -250,10 +250,14 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
                 atom._attach_to_graph(sub, n)
 
             # recalculate query marks
+            sh = self._hybridizations
             sub._hybridizations = {}
             sub._hydrogens = {}
-            for n in sub._atoms:
-                sub._calc_hybridization(n)
+            for n, m_bond in sub._bonds.items():
+                if len(m_bond) == len(sb[n]):  # all neighbors kept. hybridization not changed.
+                    sub._hybridizations[n] = sh[n]
+                else:
+                    sub._calc_hybridization(n)
                 sub._calc_implicit(n)
             # fix_stereo will repair data
             sub._atoms_stereo = self._atoms_stereo
@@ -289,6 +293,8 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
                 atom._attach_to_graph(u, n)
             return u
         elif isinstance(other, Graph):
+            if not kwargs.get('copy', True):
+                raise TypeError('inplace union of different graph types impossible')
             return other.union(self, **kwargs)
         else:
             raise TypeError('Graph expected')
@@ -304,6 +310,7 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
         sb = self._bonds
 
         bonds = []
+        append_bond = bonds.append
         adj = defaultdict(lambda: defaultdict(lambda: [None, None]))
 
         if isinstance(other, MoleculeContainer):
@@ -315,25 +322,26 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
             common = sa.keys() & other
             h = cgr.CGRContainer()
             atoms = h._atoms
+            add_atom = h.add_atom
 
             for n in sa.keys() - common:  # cleavage atoms
-                h.add_atom(sa[n], n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=sc[n], p_is_radical=sr[n])
+                add_atom(sa[n], n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=sc[n], p_is_radical=sr[n])
                 for m, bond in sb[n].items():
                     if m not in atoms:
                         if m in common:  # bond to common atoms is broken bond
                             order = bond.order
                             bond = object.__new__(DynamicBond)
                             bond._DynamicBond__order, bond._DynamicBond__p_order = order, None
-                        bonds.append((n, m, bond))
+                        append_bond((n, m, bond))
             for n in other._atoms.keys() - common:  # coupling atoms
-                h.add_atom(oa[n], n, charge=oc[n], is_radical=or_[n], xy=op[n], p_charge=oc[n], p_is_radical=or_[n])
+                add_atom(oa[n], n, charge=oc[n], is_radical=or_[n], xy=op[n], p_charge=oc[n], p_is_radical=or_[n])
                 for m, bond in ob[n].items():
                     if m not in atoms:
                         if m in common:  # bond to common atoms is formed bond
                             order = bond.order
                             bond = object.__new__(DynamicBond)
                             bond._DynamicBond__order, bond._DynamicBond__p_order = None, order
-                        bonds.append((n, m, bond))
+                        append_bond((n, m, bond))
             for n in common:
                 an = adj[n]
                 for m, bond in sb[n].items():
@@ -346,12 +354,12 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
                 san = sa[n]
                 if san.atomic_number != oa[n].atomic_number or san.isotope != oa[n].isotope:
                     raise MappingError(f'atoms with number {{{n}}} not equal')
-                h.add_atom(san, n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=oc[n], p_is_radical=or_[n])
+                add_atom(san, n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=oc[n], p_is_radical=or_[n])
                 for m, (o1, o2) in adj[n].items():
                     if m not in atoms:
                         bond = object.__new__(DynamicBond)
                         bond._DynamicBond__order, bond._DynamicBond__p_order = o1, o2
-                        bonds.append((n, m, bond))
+                        append_bond((n, m, bond))
         elif isinstance(other, cgr.CGRContainer):
             oa = other._atoms
             oc = other._charges
@@ -363,19 +371,20 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
             common = sa.keys() & other
             h = other.__class__()  # subclasses support
             atoms = h._atoms
+            add_atom = h.add_atom
 
             for n in sa.keys() - common:  # cleavage atoms
-                h.add_atom(sa[n], n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=sc[n], p_is_radical=sr[n])
+                add_atom(sa[n], n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=sc[n], p_is_radical=sr[n])
                 for m, bond in sb[n].items():
                     if m not in atoms:
                         if m in common:  # bond to common atoms is broken bond
                             order = bond.order
                             bond = object.__new__(DynamicBond)
                             bond._DynamicBond__order, bond._DynamicBond__p_order = order, None
-                        bonds.append((n, m, bond))
+                        append_bond((n, m, bond))
             for n in other._atoms.keys() - common:  # coupling atoms
-                h.add_atom(oa[n].copy(), n, charge=oc[n], is_radical=or_[n], xy=op[n], p_charge=opc[n],
-                           p_is_radical=opr[n])
+                add_atom(oa[n].copy(), n, charge=oc[n], is_radical=or_[n], xy=op[n], p_charge=opc[n],
+                         p_is_radical=opr[n])
                 for m, bond in ob[n].items():
                     if m not in atoms:
                         if m in common:  # bond to common atoms is formed bond
@@ -383,9 +392,9 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
                             if order:  # skip broken bond. X>None => None>None
                                 bond = object.__new__(DynamicBond)
                                 bond._DynamicBond__order, bond._DynamicBond__p_order = None, order
-                                bonds.append((n, m, bond))
+                                append_bond((n, m, bond))
                         else:
-                            bonds.append((n, m, bond))
+                            append_bond((n, m, bond))
             for n in common:
                 an = adj[n]
                 for m, bond in sb[n].items():
@@ -399,17 +408,16 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
                 san = sa[n]
                 if san.atomic_number != oa[n].atomic_number or san.isotope != oa[n].isotope:
                     raise MappingError(f'atoms with number {{{n}}} not equal')
-                h.add_atom(san, n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=opc[n], p_is_radical=opr[n])
+                add_atom(san, n, charge=sc[n], is_radical=sr[n], xy=sp[n], p_charge=opc[n], p_is_radical=opr[n])
                 for m, (o1, o2) in adj[n].items():
                     if m not in atoms:
                         bond = object.__new__(DynamicBond)
                         bond._DynamicBond__order, bond._DynamicBond__p_order = o1, o2
-                        bonds.append((n, m, bond))
+                        append_bond((n, m, bond))
         else:
             raise TypeError('MoleculeContainer or CGRContainer expected')
 
-        for n, m, bond in bonds:
-            h.add_bond(n, m, bond)
+        h._add_bonds(bonds)
         return h
 
     def __xor__(self, other):
@@ -490,26 +498,28 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
         self._hydrogens[n] = 0
 
     def _calc_hybridization(self, n: int):
-        hybridization = 1
+        triple = False
+        doubles = 0
         for bond in self._bonds[n].values():
             order = bond.order
             if order == 4:
                 self._hybridizations[n] = 4
                 return
             elif order == 3:
-                if hybridization != 3:
-                    hybridization = 3
+                triple = True
             elif order == 2:
-                if hybridization == 2:
-                    hybridization = 3
-                elif hybridization == 1:
-                    hybridization = 2
-        self._hybridizations[n] = hybridization
+                doubles += 1
+        if triple or doubles > 1:
+            self._hybridizations[n] = 3
+        elif doubles:
+            self._hybridizations[n] = 2
+        else:  # single or any bonds only
+            self._hybridizations[n] = 1
 
     def __getstate__(self):
         return {'conformers': self._conformers, 'atoms_stereo': self._atoms_stereo,
                 'allenes_stereo': self._allenes_stereo, 'cis_trans_stereo': self._cis_trans_stereo,
-                **super().__getstate__()}
+                'hybridizations': self._hybridizations, 'hydrogens': self._hydrogens, **super().__getstate__()}
 
     def __setstate__(self, state):
         if '_BaseContainer__meta' in state:  # 2.8 reverse compatibility
@@ -565,11 +575,15 @@ class MoleculeContainer(MoleculeStereo, Graph, Aromatize, Standardize, MoleculeS
         self._cis_trans_stereo = state['cis_trans_stereo']
 
         # restore query and hydrogen marks
-        self._hybridizations = {}
-        self._hydrogens = {}
-        for n in state['bonds']:
-            self._calc_hybridization(n)
-            self._calc_implicit(n)
+        if 'hydrogens' in state:
+            self._hybridizations = state['hybridizations']
+            self._hydrogens = state['hydrogens']
+        else:  # < 4.0.34 compatibility
+            self._hybridizations = {}
+            self._hydrogens = {}
+            for n in state['bonds']:
+                self._calc_hybridization(n)
+                self._calc_implicit(n)
 
 
 __all__ = ['MoleculeContainer']
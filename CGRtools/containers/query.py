@@ -251,6 +251,8 @@ class QueryContainer(QueryStereo, Graph, QuerySmiles, StructureComponents, Depic
         elif isinstance(other, cgr.CGRContainer):
             raise TypeError('QueryContainer and CGRContainer unite impossible')
         elif isinstance(other, Graph):
+            if not kwargs.get('copy', True):
+                raise TypeError('inplace union of different graph types impossible')
             return other.union(self, **kwargs)
         else:
             raise TypeError('Graph expected')
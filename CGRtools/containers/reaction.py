@@ -18,10 +18,8 @@
 #
 from CachedMethods import cached_method
 from collections.abc import Iterable
-from functools import reduce
 from hashlib import sha512
 from itertools import chain
-from operator import or_
 from typing import Dict, Iterable as TIterable, Iterator, Optional, Tuple, Union
 from .cgr import CGRContainer
 from .cgr_query import QueryCGRContainer
@@ -195,19 +193,28 @@ class ReactionContainer(StandardizeReaction, ReactionComponents, DepictReaction)
         if rr:
             if not isinstance(rr[0], (MoleculeContainer, CGRContainer)):
                 raise TypeError('Queries not composable')
-            r = reduce(or_, rr)
+            r = self.__union(rr)
         else:
             r = MoleculeContainer()
         if self.__products:
             if not isinstance(self.__products[0], (MoleculeContainer, CGRContainer)):
                 raise TypeError('Queries not composable')
-            p = reduce(or_, self.__products)
+            p = self.__union(self.__products)
         else:
             p = MoleculeContainer()
         c = r ^ p
         c.meta.update(self.__meta)
         return c
 
+    @staticmethod
+    def __union(graphs):
+        if len(graphs) == 1:
+            return graphs[0]
+        u = graphs[0] | graphs[1]
+        for g in graphs[2:]:  # new graph already created. merge inplace.
+            u.union(g, copy=False)
+        return u
+
     def __invert__(self):
         """
         Get CGR of reaction
@@ -16,7 +16,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with this program; if not, see <https://www.gnu.org/licenses/>.
 #
-from typing import Type
+from typing import Dict, Type
 from .core import Core
 from ...exceptions import IsNotConnectedAtom
 
@@ -87,6 +87,8 @@ class Dynamic(Core):
 
 class DynamicElement(Dynamic):
     __slots__ = ('__p_charge', '__p_is_radical')
+    __symbols: Dict[str, Type['DynamicElement']] = {}  # memo of from_symbol
+    __numbers: Dict[int, Type['DynamicElement']] = {}  # memo of from_atomic_number
 
     @property
     def atomic_symbol(self) -> str:
@@ -97,10 +99,15 @@ class DynamicElement(Dynamic):
         """
         get DynamicElement class by its symbol
         """
+        try:
+            return DynamicElement.__symbols[symbol]
+        except KeyError:
+            pass
         try:
             element = next(x for x in DynamicElement.__subclasses__() if x.__name__ == f'Dynamic{symbol}')
         except StopIteration:
             raise ValueError(f'DynamicElement with symbol "{symbol}" not found')
+        DynamicElement.__symbols[symbol] = element
         return element
 
     @classmethod
@@ -108,10 +115,15 @@ class DynamicElement(Dynamic):
         """
         get DynamicElement class by its number
         """
+        try:
+            return DynamicElement.__numbers[number]
+        except KeyError:
+            pass
         try:
             element = next(x for x in DynamicElement.__subclasses__() if x.atomic_number.fget(None) == number)
         except StopIteration:
             raise ValueError(f'DynamicElement with number "{number}" not found')
+        DynamicElement.__numbers[number] = element
         return element
 
     @property
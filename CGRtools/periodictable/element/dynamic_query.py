@@ -106,6 +106,8 @@ class DynamicQuery(Dynamic):
 
 class DynamicQueryElement(DynamicQuery):
     __slots__ = ()
+    __symbols: Dict[str, Type['DynamicQueryElement']] = {}  # memo of from_symbol
+    __numbers: Dict[int, Type['DynamicQueryElement']] = {}  # memo of from_atomic_number
 
     @property
     def atomic_symbol(self) -> str:
@@ -118,10 +120,15 @@ class DynamicQueryElement(DynamicQuery):
         """
         if symbol == 'A':
             return DynamicAnyElement
+        try:
+            return DynamicQueryElement.__symbols[symbol]
+        except KeyError:
+            pass
         try:
             element = next(x for x in DynamicQueryElement.__subclasses__() if x.__name__ == f'DynamicQuery{symbol}')
         except StopIteration:
             raise ValueError(f'DynamicQueryElement with symbol "{symbol}" not found')
+        DynamicQueryElement.__symbols[symbol] = element
         return element
 
     @classmethod
@@ -131,10 +138,15 @@ class DynamicQueryElement(DynamicQuery):
         """
         if number == 0:
             return DynamicAnyElement
+        try:
+            return DynamicQueryElement.__numbers[number]
+        except KeyError:
+            pass
         try:
             element = next(x for x in DynamicQueryElement.__subclasses__() if x.atomic_number.fget(None) == number)
         except StopIteration:
             raise ValueError(f'DynamicQueryElement with number "{number}" not found')
+        DynamicQueryElement.__numbers[number] = element
         return element
 
     def __eq__(self, other):
@@ -26,6 +26,8 @@ from ...exceptions import IsNotConnectedAtom, ValenceError
 
 class Element(Core):
     __slots__ = ()
+    __symbols: Dict[str, Type['Element']] = {}  # memo of from_symbol
+    __numbers: Dict[int, Type['Element']] = {}  # memo of from_atomic_number
     __class_cache__ = {}
 
     @property
@@ -87,10 +89,15 @@ class Element(Core):
         """
         get Element class by its symbol
         """
+        try:
+            return Element.__symbols[symbol]
+        except KeyError:
+            pass
         try:
             element = next(x for x in Element.__subclasses__() if x.__name__ == symbol)
         except StopIteration:
             raise ValueError(f'Element with symbol "{symbol}" not found')
+        Element.__symbols[symbol] = element
         return element
 
     @classmethod
@@ -98,10 +105,15 @@ class Element(Core):
         """
         get Element class by its number
         """
+        try:
+            return Element.__numbers[number]
+        except KeyError:
+            pass
         try:
             element = next(x for x in Element.__subclasses__() if x.atomic_number.fget(None) == number)
         except StopIteration:
             raise ValueError(f'Element with number "{number}" not found')
+        Element.__numbers[number] = element
         return element
 
     def __eq__(self, other):
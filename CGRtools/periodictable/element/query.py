@@ -60,6 +60,8 @@ class Query(Core):
 
 class QueryElement(Query):
     __slots__ = ()
+    __symbols: Dict[str, Type['QueryElement']] = {}  # memo of from_symbol
+    __numbers: Dict[int, Type['QueryElement']] = {}  # memo of from_atomic_number
 
     @property
     def atomic_symbol(self) -> str:
@@ -72,10 +74,15 @@ class QueryElement(Query):
         """
         if symbol == 'A':
             return AnyElement
+        try:
+            return QueryElement.__symbols[symbol]
+        except KeyError:
+            pass
         try:
             element = next(x for x in QueryElement.__subclasses__() if x.__name__ == f'Query{symbol}')
         except StopIteration:
             raise ValueError(f'QueryElement with symbol "{symbol}" not found')
+        QueryElement.__symbols[symbol] = element
         return element
 
     @classmethod
@@ -85,10 +92,15 @@ class QueryElement(Query):
         """
         if number == 0:
             return AnyElement
+        try:
+            return QueryElement.__numbers[number]
+        except KeyError:
+            pass
         try:
             element = next(x for x in QueryElement.__subclasses__() if x.atomic_number.fget(None) == number)
         except StopIteration:
             raise ValueError(f'QueryElement with number "{number}" not found')
+        QueryElement.__numbers[number] = element
         return element
 
     @Core.charge.setter